@@ -1,8 +1,15 @@
+import numpy as np
 import pandas as pd
-import missingno as msno
 import matplotlib.pyplot as plt
 
 
+# Frames with at least this many rows count duplicates via row hashes instead of df.duplicated()
+HASH_DUPLICATES_MIN_ROWS = 100_000
+
+# The missing-value matrix is averaged down to at most this many rows before plotting
+MISSING_MATRIX_MAX_ROWS = 5000
+
+
 def explore(df): 
     """ 
     Perform basic exploratory data analysis (EDA) on the given DataFrame.
@@ -31,20 +38,38 @@ def explore(df):
     print(f'\n Number of unique values: \n {df.nunique()}')
 
     #duplicates
-    print(f'\n Sum of duplicates: {df.duplicated().sum()}\n') 
+    if len(df) >= HASH_DUPLICATES_MIN_ROWS:
+        # One vectorized 64-bit hash per row, then count repeated hashes. A collision
+        # (false duplicate) has probability ~ n^2 / 2^65, negligible even for 10^7 rows.
+        row_hashes = pd.util.hash_pandas_object(df, index=False).to_numpy()
+        _, counts = np.unique(row_hashes, return_counts=True)
+        n_duplicates = int((counts - 1).sum())
+    else:
+        n_duplicates = int(df.duplicated().sum())
+    print(f'\n Sum of duplicates: {n_duplicates}\n') 
 
     #missing values
-    sum_missing = df.isna().sum()
+    missing_mask = df.isna().to_numpy()
+    sum_missing = missing_mask.sum(axis=0)
     perc_missing = (sum_missing / len(df)) * 100
     missing_df = pd.DataFrame({
-        'Column': sum_missing.index,
-        'Sum of NaNs': sum_missing.values,
-        'Perc of NaNs': perc_missing.values
+        'Column': df.columns,
+        'Sum of NaNs': sum_missing,
+        'Perc of NaNs': perc_missing
     })
 
     print(f'Missing values: \n {missing_df.to_string(index=False, float_format="%.2f")}')
 
-    # visualize missing values
-    msno.matrix(df)
-    plt.title("Missing data by column", fontsize=20, fontweight="bold")
+    # visualize missing values, averaging blocks of rows so large frames render a small image
+    if len(missing_mask) > MISSING_MATRIX_MAX_ROWS:
+        edges = np.linspace(0, len(missing_mask), MISSING_MATRIX_MAX_ROWS + 1).astype(int)
+        missing_mask = np.add.reduceat(missing_mask, edges[:-1], axis=0) / np.diff(edges)[:, None]
+
+    plt.figure(figsize=(25, 10))
+    plt.imshow(missing_mask, aspect='auto', cmap='gray', vmin=0, vmax=1, interpolation='nearest',
+               extent=(-0.5, len(df.columns) - 0.5, len(df), 0))  # y axis in original row numbers
+    plt.xticks(range(len(df.columns)), df.columns, rotation=45, ha='left')
+    plt.tick_params(axis='x', top=True, labeltop=True, bottom=False, labelbottom=False)
+    plt.ylabel('Row')
+    plt.title("Missing data by column (white = missing)", fontsize=20, fontweight="bold")
     plt.show()
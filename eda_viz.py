@@ -2,6 +2,7 @@ import matplotlib.pyplot as plt
 import seaborn as sns
 import pandas as pd
 import math
+import numpy as np
 from scipy import stats
 
 
@@ -138,7 +139,98 @@ def plot_categorical_countplots(df_cat):
 
 # correlations and distributions
 
-def corrdot(*args, **kwargs):
+# Colormap and normalization of the correlation dots, resolved once instead of per grid cell
+_CORR_CMAP = plt.get_cmap('coolwarm')
+_CORR_NORM = plt.Normalize(vmin=-1, vmax=1)
+
+
+def _pearson_matrix(df):
+    """
+    Compute the Pearson correlation matrix and the matching two-sided p-values in one pass.
+
+    Missing values are handled by pairwise deletion, like `Series.corr`: each pair of columns
+    uses only the rows where both values are present.
+
+    Parameters:
+    df (pd.DataFrame): A DataFrame containing only numerical columns.
+
+    Returns:
+    tuple: (pd.DataFrame, pd.DataFrame) correlation coefficients and p-values, both indexed by column name.
+    """
+    values = df.to_numpy(dtype=float)
+    present = ~np.isnan(values)
+    weights = present.astype(float)
+
+    # Center by the column means to keep the sums below well conditioned (shifts don't change r),
+    # then zero out missing values so they drop out of every matrix product
+    values = np.where(present, values - np.nanmean(values, axis=0), 0)
+
+    # Per pair (i, j): number of complete rows, sums of x_i and x_j over those rows, and
+    # the sums of squares and cross products, all as matrix products
+    n = weights.T @ weights
+    sum_i = values.T @ weights
+    sum_j = sum_i.T
+    sq_i = (values ** 2).T @ weights
+    sq_j = sq_i.T
+    cross = values.T @ values
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        cov = cross - sum_i * sum_j / n
+        var_i = sq_i - sum_i ** 2 / n
+        var_j = sq_j - sum_j ** 2 / n
+        r = np.clip(cov / np.sqrt(var_i * var_j), -1, 1)
+
+        # t-statistic with n-2 degrees of freedom, |r| = 1 gives t = inf and p = 0
+        t = r * np.sqrt((n - 2) / (1 - r ** 2))
+    p = 2 * stats.t.sf(np.abs(t), n - 2)
+
+    return (pd.DataFrame(r, index=df.columns, columns=df.columns),
+            pd.DataFrame(p, index=df.columns, columns=df.columns))
+
+
+def _draw_corrdot(ax, corr_r):
+    """
+    Draw the correlation dot and its value onto the given Axes.
+
+    Parameters:
+    ax (matplotlib.axes.Axes): The Axes to draw on.
+    corr_r (float): Pearson correlation coefficient.
+
+    Returns:
+    None
+    """
+    corr_text = f"{corr_r:2.2f}".replace("0.", ".")
+    ax.set_axis_off()
+    marker_size = abs(corr_r) * 10000
+    ax.scatter([.5], [.5], marker_size, c=[_CORR_CMAP(_CORR_NORM(corr_r))], alpha=0.6,
+               transform=ax.transAxes)
+    font_size = abs(corr_r) * 40 + 5
+    ax.annotate(corr_text, [.5, .5], xycoords="axes fraction",
+                ha='center', va='center', fontsize=font_size)
+
+
+def _draw_p_stars(ax, p):
+    """
+    Annotate the given Axes with asterisks for the significance level of a p-value.
+
+    Parameters:
+    ax (matplotlib.axes.Axes): The Axes to annotate.
+    p (float): p-value of the correlation.
+
+    Returns:
+    None
+    """
+    p_stars = ''
+    if p <= 0.05:
+        p_stars = '*'
+    if p <= 0.01:
+        p_stars = '**'
+    if p <= 0.001:
+        p_stars = '***'
+    ax.annotate(p_stars, xy=(0.75, 0.7), xycoords=ax.transAxes)
+
+
+def corrdot(*args, corr_matrix=None, **kwargs):
     """
     Create a visual representation of the Pearson correlation coefficient.
 
@@ -150,6 +242,7 @@ def corrdot(*args, **kwargs):
     *args: 
         args[0] (pd.Series): First variable for correlation analysis.
         args[1] (pd.Series): Second variable for correlation analysis.
+    corr_matrix (pd.DataFrame, optional): Precomputed correlation matrix, looked up by the Series names.
     **kwargs: Additional keyword arguments for compatibility with Seaborn's PairGrid.
 
     Returns:
@@ -160,19 +253,20 @@ def corrdot(*args, **kwargs):
     - The color is determined by a "coolwarm" colormap, ranging from -1 to 1.
     - The correlation value is displayed inside the dot with a dynamic font size.
     """
-    corr_r = args[0].corr(args[1], 'pearson')
-    corr_text = f"{corr_r:2.2f}".replace("0.", ".")
-    ax = plt.gca()
-    ax.set_axis_off()
-    marker_size = abs(corr_r) * 10000
-    ax.scatter([.5], [.5], marker_size, [corr_r], alpha=0.6, cmap="coolwarm",
-               vmin=-1, vmax=1, transform=ax.transAxes)
-    font_size = abs(corr_r) * 40 + 5
-    ax.annotate(corr_text, [.5, .5], xycoords="axes fraction",
-                ha='center', va='center', fontsize=font_size)
+    if corr_matrix is not None:
+        corr_r = corr_matrix.at[args[0].name, args[1].name]
+    elif args[0].index.equals(args[1].index):
+        # PairGrid passes Series from the same frame, already aligned, so skip pandas' alignment
+        a = args[0].to_numpy(dtype=float)
+        b = args[1].to_numpy(dtype=float)
+        valid = ~(np.isnan(a) | np.isnan(b))
+        corr_r = float(np.corrcoef(a[valid], b[valid])[0, 1])
+    else:
+        corr_r = args[0].corr(args[1], 'pearson')
+    _draw_corrdot(plt.gca(), corr_r)
 
     
-def corrfunc(x, y, **kws):
+def corrfunc(x, y, p_matrix=None, **kws):
     """
     Annotate a plot with the significance level of the Pearson correlation between two variables.
 
@@ -188,21 +282,44 @@ def corrfunc(x, y, **kws):
     Parameters:
     x (array-like): First variable for correlation analysis.
     y (array-like): Second variable for correlation analysis.
+    p_matrix (pd.DataFrame, optional): Precomputed p-value matrix, looked up by the Series names.
     **kws: Additional keyword arguments for compatibility with Seaborn's PairGrid.
 
     Returns:
     None: The function directly annotates the active matplotlib Axes.
     """
-    r, p = stats.pearsonr(x, y)
-    p_stars = ''
-    if p <= 0.05:
-        p_stars = '*'
-    if p <= 0.01:
-        p_stars = '**'
-    if p <= 0.001:
-        p_stars = '***'
+    if p_matrix is not None:
+        p = p_matrix.at[x.name, y.name]
+    else:
+        r, p = stats.pearsonr(x, y)
+    _draw_p_stars(plt.gca(), p)
+
+
+def corr_panel(x, y, corr_matrix=None, p_matrix=None, **kws):
+    """
+    Draw the correlation dot and the significance asterisks for one pair of variables.
+
+    Combines `corrdot` and `corrfunc` into a single PairGrid callback, so the Pearson
+    correlation and its p-value are obtained once per grid cell.
+
+    Parameters:
+    x (pd.Series): First variable for correlation analysis.
+    y (pd.Series): Second variable for correlation analysis.
+    corr_matrix (pd.DataFrame, optional): Precomputed correlation matrix, looked up by the Series names.
+    p_matrix (pd.DataFrame, optional): Precomputed p-value matrix, looked up by the Series names.
+    **kws: Additional keyword arguments for compatibility with Seaborn's PairGrid.
+
+    Returns:
+    None: The function directly modifies the current matplotlib Axes.
+    """
+    if corr_matrix is not None and p_matrix is not None:
+        corr_r = corr_matrix.at[x.name, y.name]
+        p = p_matrix.at[x.name, y.name]
+    else:
+        corr_r, p = stats.pearsonr(x, y)
     ax = plt.gca()
-    ax.annotate(p_stars, xy=(0.75, 0.7), xycoords=ax.transAxes)
+    _draw_corrdot(ax, corr_r)
+    _draw_p_stars(ax, p)
 
 
 def corr_dist_grid(correlation_data):
@@ -223,10 +340,14 @@ def corr_dist_grid(correlation_data):
     sns.set_theme(style='white', font_scale=1.6)
 
     grid = sns.PairGrid(correlation_data, aspect=1.4, diag_sharey=False)
+
+    # Compute all pairwise correlations once instead of per grid cell, on the numeric
+    # columns the grid actually plots
+    corr_matrix, p_matrix = _pearson_matrix(correlation_data[grid.x_vars])
+
     grid.map_lower(sns.regplot, lowess=True, ci=False, line_kws={'color': 'black'})
     grid.map_diag(sns.histplot, kde=True, color='black')
-    grid.map_upper(corrdot)
-    grid.map_upper(corrfunc)
+    grid.map_upper(corr_panel, corr_matrix=corr_matrix, p_matrix=p_matrix)
 
     return grid
 
@@ -1,6 +1,198 @@
+import re
+import weakref
+from functools import reduce
+
+import numpy as np
+import pandas as pd
 import plotly.graph_objs as go
+from shapely.geometry import mapping, shape
+
+
+def normalize_column(column):
+    """
+    Min-max normalizes a column to the range [0, 1].
+
+    Parameters:
+    column (array-like): Values to normalize, e.g. a pd.Series or np.ndarray.
+
+    Returns:
+    np.ndarray: The normalized values.
+    """
+    values = np.asarray(column, dtype=np.float64)
+    lo = values.min()
+    # One output allocation, the division happens in place
+    normalized = values - lo
+    normalized /= values.max() - lo
+    return normalized
+
+
+def _join_hover_text(*parts):
+    """
+    Concatenates string scalars and arrays element-wise into one array of hover texts.
+
+    Parameters:
+    *parts (str or np.ndarray): Pieces of the hover text, in order. Arrays must be of string dtype.
+
+    Returns:
+    np.ndarray: One hover text per row.
+    """
+    return reduce(np.char.add, parts)
+
+
+def _distinct_as_str(values):
+    """
+    Converts low-cardinality values (e.g. quality scores, bedroom counts) to strings,
+    formatting each distinct value only once.
+
+    Parameters:
+    values (array-like): Values to convert.
+
+    Returns:
+    np.ndarray: The values as a string array.
+    """
+    values = np.asarray(values)
+    # Object columns may mix types (e.g. None and numbers), convert them element-wise as before
+    if values.dtype == object:
+        return values.astype(str)
+
+    # factorize needs no ordering of the values, unlike np.unique
+    codes, distinct = pd.factorize(values, use_na_sentinel=False)
+    return np.asarray(distinct).astype(str)[codes]
+
+
+def _zip_codes_as_str(zipcodes):
+    """
+    Converts zip codes to the strings used as GeoJSON ids, e.g. 98001.0 -> '98001'.
+
+    Parameters:
+    zipcodes (array-like): Zip codes as integers, floats (e.g. after a merge or with NaNs) or strings.
+
+    Returns:
+    np.ndarray: The zip codes as a string array.
+    """
+    values = np.asarray(zipcodes)
+    # Float zip codes would otherwise turn into '98001.0' and match no GeoJSON feature
+    if values.dtype.kind == 'f' and np.all(np.isfinite(values)) and np.all(values == np.round(values)):
+        values = values.astype(np.int64)
+    return values.astype(str)
+
+
+# Prefix of the school descriptions, e.g. 'School-Elementary' -> 'Elementary'
+_SCHOOL_PREFIX = re.compile('school-', re.IGNORECASE)
+
+
+# Results derived from a DataFrame, keyed by (id(df), *key); an entry is dropped once its
+# source DataFrame is garbage collected, so a reused id() never hits a stale result.
+_frame_cache = {}
+
+
+def _cached_for_frame(df, key, build, fingerprint=None):
+    """
+    Returns the result of `build`, computing it only once per DataFrame and key.
+
+    Parameters:
+    df (pd.DataFrame): The DataFrame the result is derived from.
+    key (tuple): Further hashable arguments the result depends on.
+    build (callable): Computes the result, called without arguments on a cache miss.
+    fingerprint (hashable, optional): Summary of the frame's current content. If it differs
+        from the one stored with the entry, the result is rebuilt and replaces the entry.
+
+    Returns:
+    object: The cached result. Treat as read-only, it is shared between calls.
+    """
+    full_key = (id(df), *key)
+    cached = _frame_cache.get(full_key)
+    if cached is None:
+        weakref.finalize(df, _frame_cache.pop, full_key, None)
+    if cached is None or cached[0] != fingerprint:
+        cached = _frame_cache[full_key] = (fingerprint, build())
+    return cached[1]
+
+
+def _agg_zip_quality(df, zipcode_col, quality_col):
+    """
+    Aggregates the average quality per zip code.
+
+    Parameters:
+    df (pd.DataFrame): Input DataFrame containing house data, either per house or already per zip code.
+    zipcode_col (str): Column name for zip codes.
+    quality_col (str): Column name for house quality.
+
+    Returns:
+    pd.DataFrame: One row per zip code (categorical dtype) with the mean quality.
+    """
+    # Group on categorical codes rather than hashing the raw zip codes
+    zipcodes = df[zipcode_col].astype('category')
+    return df[quality_col].groupby(zipcodes, sort=False, observed=True).mean().reset_index()
+
+
+# Filtered GeoJSONs keyed by (id(counties), frozenset(zips)). Each entry keeps its source
+# dict alive, so the id() cannot be reused while it is cached; the oldest entries are
+# dropped beyond _GEOJSON_CACHE_SIZE.
+_geojson_cache = {}
+_GEOJSON_CACHE_SIZE = 32
+
+
+def _filter_geojson(counties, zips):
+    """
+    Reduces a zip code GeoJSON to the features of the given zip codes, reusing the result for repeated calls.
+
+    Parameters:
+    counties (dict): GeoJSON data with the zip code in 'properties.ZCTA5CE10'. Anything else,
+        e.g. a URL, is returned unchanged.
+    zips (iterable of str): Zip codes to keep.
+
+    Returns:
+    dict: GeoJSON FeatureCollection with only the matching features.
+    """
+    if not isinstance(counties, dict):
+        return counties
+
+    zips = frozenset(zips)
+    key = (id(counties), zips)
+    if key not in _geojson_cache:
+        if len(_geojson_cache) >= _GEOJSON_CACHE_SIZE:
+            _geojson_cache.pop(next(iter(_geojson_cache)))
+        filtered = {
+            'type': 'FeatureCollection',
+            'features': [f for f in counties.get('features', []) if (f.get('properties') or {}).get('ZCTA5CE10') in zips]
+        }
+        _geojson_cache[key] = (counties, filtered)
+    return _geojson_cache[key][1]
 
 
+# Simplified GeoJSON copies keyed by (id(geojson), tolerance), bounded like _geojson_cache
+_simplified_cache = {}
+_SIMPLIFIED_CACHE_SIZE = 8
+
+
+def _simplify_geojson(geojson, tolerance):
+    """
+    Returns a copy of a GeoJSON FeatureCollection with simplified geometries, reusing it for repeated calls.
+
+    Parameters:
+    geojson (dict): GeoJSON FeatureCollection. It is not modified.
+    tolerance (float): Simplification tolerance in the units of the coordinates.
+
+    Returns:
+    dict: GeoJSON FeatureCollection with the simplified geometries. Features without a
+        geometry are kept as they are.
+    """
+    key = (id(geojson), tolerance)
+    if key not in _simplified_cache:
+        if len(_simplified_cache) >= _SIMPLIFIED_CACHE_SIZE:
+            _simplified_cache.pop(next(iter(_simplified_cache)))
+        features = []
+        for feature in geojson.get('features', []):
+            if feature.get('geometry') is not None:
+                geometry = shape(feature['geometry']).simplify(tolerance, preserve_topology=True)
+                feature = {**feature, 'geometry': mapping(geometry)}
+            features.append(feature)
+        _simplified_cache[key] = (geojson, {**geojson, 'features': features})
+    return _simplified_cache[key][1]
+
+#----------------------------------------------------------------------------------------------------------
+
 # Visualizes houses with their respective price and number of bedrooms on a scatter mapbox plot.
 
 
@@ -26,39 +218,68 @@ def plotting_houses(df, fig, price_col='price', quality_col='house_quality', bed
 
     Example:
     >>> df = pd.read_csv('your_dataset.csv')
-    >>> plotting_houses(df)
+    >>> plotting_houses(df, fig)
+    """
+    fig.add_trace(houses_trace(df, price_col, quality_col, bedrooms_col, lat_col, long_col, legend_entry))
+
+
+def houses_trace(df, price_col='price', quality_col='house_quality', bedrooms_col='bedrooms', lat_col='lat', long_col='long', legend_entry = 'Houses <br>cheap (small) to expensive (large)'):
+    """
+    Builds the scatter mapbox trace of houses with their respective price and number of bedrooms.
+
+    Parameters:
+    df (pd.DataFrame): Input DataFrame containing house data.
+    price_col (str): Column name for house prices. Default is 'price'.
+    quality_col (str):  Column name for house quality. Default is 'house_quality'.
+    bedrooms_col (str): Column name for the number of bedrooms. Default is 'bedrooms'.
+    lat_col (str): Column name for latitude. Default is 'lat'.
+    long_col (str): Column name for longitude. Default is 'long'.
+    legend_entry (str): legend entry name for the scatter plot. Default is 'Houses'.
+
+    Raises:
+    ValueError: If any of the required columns are missing in the input DataFrame.
+
+    Returns:
+    go.Scattermapbox: The houses trace.
+
+    Example:
+    >>> df = pd.read_csv('your_dataset.csv')
+    >>> fig.add_traces([houses_trace(df)])
     """
 
     # Ensure required columns are present
     required_columns = [price_col, quality_col, bedrooms_col, lat_col, long_col]
-    for col in required_columns:
-        if col not in df.columns:
-            raise ValueError(f'Missing required column: {col}')
+    missing = set(required_columns) - set(df.columns)
+    if missing:
+        raise ValueError(f'Missing required columns: {sorted(missing)}')
 
     
     # Create hover text
-    df['hover_text'] = 'Price: ' + df[price_col].astype(int).astype(str) + '$' + \
-        '<br>Quality: ' + df[quality_col].astype(str) + \
-        '<br>Bedrooms: ' + df[bedrooms_col].astype(str)
-
-    # Normalize column for marker size
-    def normalize_column(column):
-        return (column - column.min()) / (column.max() - column.min())
+    hover_text = _join_hover_text(
+        'Price: ', df[price_col].to_numpy(dtype=np.int64).astype(str), '$<br>Quality: ',
+        _distinct_as_str(df[quality_col]), '<br>Bedrooms: ',
+        _distinct_as_str(df[bedrooms_col])
+    )
 
+    # Normalize prices for marker size, +1 to avoid the cheapest price being =0 after normalization
+    sizes = normalize_column(df[price_col].to_numpy())
+    sizes += 1
+    sizes *= 10
+    sizes = sizes.astype(np.float32)
 
-    fig.add_trace(go.Scattermapbox(
-        lat=df[lat_col],
-        lon=df[long_col],
+    return go.Scattermapbox(
+        lat=df[lat_col].to_numpy(np.float32),  # float32 (~1 m here) halves the serialized figure
+        lon=df[long_col].to_numpy(np.float32),
         mode='markers',
         marker=go.scattermapbox.Marker(
-            size=(normalize_column(df[price_col]) + 1) * 10,  # Normalize sizes, +1 to avoid the cheapest price being =0 after normalization
+            size=sizes,
             color='blue'
         ),
-        text=df['hover_text'],
+        text=hover_text,
         hoverinfo='text',
         name= legend_entry,  # Legend entry
         showlegend=True
-    ))
+    )
 
 #----------------------------------------------------------------------------------------------------------
 
@@ -68,7 +289,7 @@ def add_choropleth_map(df, fig, counties, zipcode_col='zipcode', house_quality_c
 
     Parameters:
     fig (go.Figure): Plotly figure to add the choropleth map to.
-    df (pd.DataFrame): Input DataFrame containing house data.
+    df (pd.DataFrame): Input DataFrame containing house data. Averaged per zip code if not already aggregated.
     counties (dict): GeoJSON data for the counties.
     zipcode_col (str): Column name for zip codes. Default is 'zipcode'.
     house_quality_col (str): Column name for house quality. Default is average 'house_quality'.
@@ -85,33 +306,89 @@ def add_choropleth_map(df, fig, counties, zipcode_col='zipcode', house_quality_c
     >>> df = pd.read_csv('your_dataset.csv')
     >>> add_choropleth_map(fig, df, counties, legend_entry='Average House Quality')
     """
+    fig.add_trace(choropleth_trace(df, counties, zipcode_col, house_quality_col, legend_entry))
+
+
+def choropleth_trace(df, counties, zipcode_col='zipcode', house_quality_col='house_quality', legend_entry='Average house quality <br>low (dark red) to high (bright yellow)'):
+    """
+    Builds the choropleth trace of average house quality per zip code.
+
+    Parameters:
+    df (pd.DataFrame): Input DataFrame containing house data. Averaged per zip code if not already aggregated.
+    counties (dict): GeoJSON data for the counties.
+    zipcode_col (str): Column name for zip codes. Default is 'zipcode'.
+    house_quality_col (str): Column name for house quality. Default is average 'house_quality'.
+    legend_entry (str): Legend entry name for the choropleth map. Default is 'Average house quality'.
+
+    Raises:
+    ValueError: If any of the required columns are missing in the input DataFrame.
+
+    Returns:
+    go.Choroplethmapbox: The choropleth trace.
+    """
     # Ensure required columns are present
     required_columns = [zipcode_col, house_quality_col]
-    for col in required_columns:
-        if col not in df.columns:
-            raise ValueError(f'Missing required column: {col}')
+    missing = set(required_columns) - set(df.columns)
+    if missing:
+        raise ValueError(f'Missing required columns: {sorted(missing)}')
 
-    # Create hover text
-    df['hover_text'] = 'Zipcode: ' + df[zipcode_col].astype(str) + '<br>Quality: ' + df[house_quality_col].astype(str)
-
-    # Add the choropleth map
-    fig.add_trace(go.Choroplethmapbox(
-        geojson=counties,
-        locations=df[zipcode_col],
-        z=df[house_quality_col],
-        colorscale='Hot',
-        showscale=False,  # Remove color scale
-        marker_opacity=0.4,  # Reduce opacity so clicks and hover can pass through
-        featureidkey='properties.ZCTA5CE10',
-        name=legend_entry,  # Legend entry
-        text=df['hover_text'],
-        hoverinfo='text',
-        showlegend=True  # Ensure it appears in the legend
-    ))
+    # Built once per DataFrame and GeoJSON
+    return _choropleth_trace(df, counties, zipcode_col, house_quality_col, legend_entry)
+
+
+def _choropleth_trace(df, counties, zipcode_col, house_quality_col, legend_entry):
+    """
+    Builds the choropleth trace for `choropleth_trace`, reusing it for repeated calls on the same data.
+
+    The cache entry stores a hash of the zip code and quality columns, so editing `df` in place
+    rebuilds and replaces it. The cache entry holds a reference to `counties`, so its id() stays unique
+    while the entry exists.
+
+    Parameters:
+    df (pd.DataFrame): Input DataFrame containing house data.
+    counties (dict): GeoJSON data for the counties.
+    zipcode_col (str): Column name for zip codes.
+    house_quality_col (str): Column name for house quality.
+    legend_entry (str): Legend entry name for the choropleth map.
+
+    Returns:
+    go.Choroplethmapbox: The choropleth trace.
+    """
+    def build():
+        # Average quality per zip code (a no-op on already aggregated frames)
+        df_zip = _agg_zip_quality(df, zipcode_col, house_quality_col)
+
+        zipcodes = _zip_codes_as_str(df_zip[zipcode_col])  # GeoJSON ids are strings
+
+        # Create hover text
+        hover_text = _join_hover_text(
+            'Zipcode: ', zipcodes, '<br>Quality: ',
+            df_zip[house_quality_col].to_numpy().astype(str)
+        )
+
+        trace = go.Choroplethmapbox(
+            geojson=_filter_geojson(counties, zipcodes),  # Only ship the zip codes that are plotted
+            locations=zipcodes,
+            z=df_zip[house_quality_col].to_numpy(np.float32),
+            colorscale='Hot',
+            showscale=False,  # Remove color scale
+            marker_opacity=0.4,  # Reduce opacity so clicks and hover can pass through
+            featureidkey='properties.ZCTA5CE10',
+            name=legend_entry,  # Legend entry
+            text=hover_text,
+            hoverinfo='text',
+            showlegend=True  # Ensure it appears in the legend
+        )
+        return counties, trace
+
+    # Content fingerprint of the plotted columns, so in-place edits of df rebuild the trace
+    fingerprint = int(pd.util.hash_pandas_object(df[[zipcode_col, house_quality_col]], index=False).sum())
+    key = ('choropleth', id(counties), zipcode_col, house_quality_col, legend_entry)
+    return _cached_for_frame(df, key, build, fingerprint)[1]
 
 #----------------------------------------------------------------------------------------------------------
 
-def add_park_outlines_layer(fig, parks, legend_entry='Park outlines'):
+def add_park_outlines_layer(fig, parks, legend_entry='Park outlines', tolerance=0.0005):
     """
     Adds a scattermapbox dummy point for the legend and a geojson layer for park outlines to a Plotly figure.
 
@@ -119,6 +396,10 @@ def add_park_outlines_layer(fig, parks, legend_entry='Park outlines'):
     fig (go.Figure): Plotly figure to add the layers to.
     parks (dict): GeoJSON data for the parks.
     legend_entry (str): Legend entry name for the scattermapbox. Default is 'Park outlines'.
+    tolerance (float or None): Tolerance in degrees for simplifying the park outlines, 0.0005 is
+        roughly 50 m. A simplified copy is built once per GeoJSON and tolerance and reused
+        afterwards, `parks` itself is left unchanged. None keeps the outlines as they are.
+        Default is 0.0005.
 
     Returns:
     None
@@ -129,32 +410,62 @@ def add_park_outlines_layer(fig, parks, legend_entry='Park outlines'):
     >>> add_park_outlines_layer(fig, parks, legend_entry='Park outlines')
     """
     # Add scattermapbox dummy point for the legend
-    fig.add_trace(go.Scattermapbox(
+    fig.add_trace(park_outlines_legend_trace(legend_entry))
+
+    # Add geojson layer for the actual lines
+    fig.update_layout(mapbox_layers=[park_outlines_layer(parks, tolerance)])
+
+
+def park_outlines_legend_trace(legend_entry='Park outlines'):
+    """
+    Builds the scattermapbox dummy point that gives the park outlines layer a legend entry.
+
+    Parameters:
+    legend_entry (str): Legend entry name for the scattermapbox. Default is 'Park outlines'.
+
+    Returns:
+    go.Scattermapbox: The legend trace.
+    """
+    return go.Scattermapbox(
         lat=[None],  # Dummy point, so legend displays
         lon=[None],
         mode='lines',
         line=dict(width=3, color='green'),
         name=legend_entry,  # Legend entry
         showlegend=True
-    ))
-
-    # Add geojson layer for the actual lines
-    fig.update_layout(
-        mapbox_layers=[
-            {
-                'sourcetype': 'geojson',
-                'source': parks,
-                'type': 'line',
-                'color': 'green',
-                'line': {'width': 1.5}
-            }
-        ]
     )
 
 
+def park_outlines_layer(parks, tolerance=0.0005):
+    """
+    Builds the mapbox geojson layer drawing the park outlines.
+
+    Parameters:
+    parks (dict): GeoJSON data for the parks.
+    tolerance (float or None): Tolerance in degrees for simplifying the park outlines, 0.0005 is
+        roughly 50 m. A simplified copy is built once per GeoJSON and tolerance and reused
+        afterwards, `parks` itself is left unchanged. None keeps the outlines as they are.
+        Default is 0.0005.
+
+    Returns:
+    dict: The layer, to be passed in the figure's `mapbox_layers`.
+    """
+    # Simplify the outlines once, fewer vertices means less GeoJSON shipped to the browser
+    if tolerance is not None and isinstance(parks, dict):
+        parks = _simplify_geojson(parks, tolerance)
+
+    return {
+        'sourcetype': 'geojson',
+        'source': parks,
+        'type': 'line',
+        'color': 'green',
+        'line': {'width': 1.5}
+    }
+
+
 #----------------------------------------------------------------------------------------------------------
 
-def add_schools_layer(fig, gdf_schools, lat_col='LAT_CEN', lon_col='LONG_CEN', name_col='ABB_NAME', desc_col='FEATUREDES', legend_entry='Schools'):
+def add_schools_layer(fig, gdf_schools, lat_col='LAT_CEN', lon_col='LONG_CEN', name_col='ABB_NAME', desc_col='FEATUREDES', legend_entry='Schools', grid_precision=4):
     """
     Adds a Scattermapbox layer for schools in King County to a Plotly figure.
 
@@ -166,18 +477,48 @@ def add_schools_layer(fig, gdf_schools, lat_col='LAT_CEN', lon_col='LONG_CEN', n
     name_col (str): Column name for school name. Default is 'ABB_NAME'.
     desc_col (str): Column name for school description. Default is 'FEATUREDES'.
     legend_entry (str): The name to display in the legend. Default is 'Schools'.
+    grid_precision (int or None): Decimals the coordinates are rounded to before dropping schools
+        at the same location, 4 is roughly 11 m. None keeps all schools. Default is 4.
     
     Returns:
     None
     """
+    fig.add_trace(schools_trace(gdf_schools, lat_col, lon_col, name_col, desc_col, legend_entry, grid_precision))
+
+
+def schools_trace(gdf_schools, lat_col='LAT_CEN', lon_col='LONG_CEN', name_col='ABB_NAME', desc_col='FEATUREDES', legend_entry='Schools', grid_precision=4):
+    """
+    Builds the Scattermapbox trace for schools in King County.
+
+    Parameters:
+    gdf_schools (pd.DataFrame): The GeoDataFrame containing school data.
+    lat_col (str): Column name for latitude. Default is 'LAT_CEN'.
+    lon_col (str): Column name for longitude. Default is 'LONG_CEN'.
+    name_col (str): Column name for school name. Default is 'ABB_NAME'.
+    desc_col (str): Column name for school description. Default is 'FEATUREDES'.
+    legend_entry (str): The name to display in the legend. Default is 'Schools'.
+    grid_precision (int or None): Decimals the coordinates are rounded to before dropping schools
+        at the same location, 4 is roughly 11 m. None keeps all schools. Default is 4.
+
+    Returns:
+    go.Scattermapbox: The schools trace.
+    """
+    # Keep one school per rounded location, stacked markers only add to the plot size
+    if grid_precision is not None:
+        coords = np.stack([
+            gdf_schools[lat_col].to_numpy().round(grid_precision),
+            gdf_schools[lon_col].to_numpy().round(grid_precision)
+        ], axis=1)
+        _, first_idx = np.unique(coords, axis=0, return_index=True)
+        gdf_schools = gdf_schools.iloc[np.sort(first_idx)]
+
     # Create hover text
-    gdf_schools['hover_text'] = gdf_schools[name_col].astype(str) + '<br>' + gdf_schools[desc_col].str.replace('School-', '', case=False).str.strip().astype(str)
-    
+    descriptions = np.array([_SCHOOL_PREFIX.sub('', str(desc)).strip() for desc in gdf_schools[desc_col].to_numpy()], dtype=str)
+    hover_text = _join_hover_text(gdf_schools[name_col].to_numpy().astype(str), '<br>', descriptions)
 
-    # Add the schools layer
-    fig.add_trace(go.Scattermapbox(
-        lat=gdf_schools[lat_col],
-        lon=gdf_schools[lon_col],
+    return go.Scattermapbox(
+        lat=gdf_schools[lat_col].to_numpy(np.float32),  # float32 (~1 m here) halves the serialized figure
+        lon=gdf_schools[lon_col].to_numpy(np.float32),
         mode='markers',
         marker=dict(  # use dict to force chosen color and avoid interference with other layers
             size=4,  # Increased size for better visibility
@@ -185,17 +526,17 @@ def add_schools_layer(fig, gdf_schools, lat_col='LAT_CEN', lon_col='LONG_CEN', n
             opacity=0.8,  # Adjust opacity for contrast
             symbol="circle"  # Explicitly set symbol type to avoid color inheritance
         ),
-        text=gdf_schools['hover_text'],
+        text=hover_text,
         hoverinfo='text',
         name=legend_entry,
         showlegend=True
-    ))
+    )
 
 
 #----------------------------------------------------------------------------------------------------------
 
 
-def update_map_layout(fig, lat, lon, mapbox_style='open-street-map'):
+def update_map_layout(fig, lat, lon, mapbox_style='open-street-map', zoom=9, mapbox_layers=None):
     """
     Updates the layout of a Plotly figure with specific map and legend settings.
 
@@ -204,6 +545,9 @@ def update_map_layout(fig, lat, lon, mapbox_style='open-street-map'):
     lat (float): Latitude for the map center.
     lon (float): Longitude for the map center.
     mapbox_style (str): Style of the mapbox. Default is 'open-street-map'.
+    zoom (float): Zoom level of the map. Default is 9.
+    mapbox_layers (list, optional): Mapbox layers to set, e.g. from `park_outlines_layer`.
+        Existing layers are kept if not given.
 
     Returns:
     None
@@ -214,7 +558,7 @@ def update_map_layout(fig, lat, lon, mapbox_style='open-street-map'):
     """
     fig.update_layout(
         mapbox_style=mapbox_style,
-        mapbox_zoom=9,
+        mapbox_zoom=zoom,
         mapbox_center={"lat": lat, "lon": lon},
         margin={"r": 0, "t": 0, "l": 0, "b": 0},
         legend=dict(
@@ -228,12 +572,86 @@ def update_map_layout(fig, lat, lon, mapbox_style='open-street-map'):
         width=1000,  # Change the width as needed
         height=1000  # Change the height as needed
     )
+
+    if mapbox_layers is not None:
+        fig.update_layout(mapbox_layers=mapbox_layers)
+    
+#----------------------------------------------------------------------------------------------------------
+
+def build_figure(
+    df_houses=None, df_schools=None, df_county=None, parks=None, county=None,
+    lat=47.3464, lon=-121.9861, mapbox_style='open-street-map'
+):
+    """
+    Builds an interactive map with optional layers for houses, schools, county data, and park outlines.
+
+    Parameters:
+    df_houses (DataFrame, optional): DataFrame containing house data to be plotted on the map.
+    df_schools (DataFrame, optional): DataFrame containing school data to be plotted on the map.
+    df_county (DataFrame, optional): DataFrame containing county data to be plotted as a choropleth map.
+    parks (GeoDataFrame, optional): GeoDataFrame containing park outlines to be plotted on the map.
+    county (dict, optional): GeoJSON data for the counties used by the choropleth map.
+    lat (float, optional): Latitude coordinate for centering the map. Default is 47.3464.
+    lon (float, optional): Longitude coordinate for centering the map. Default is -121.9861.
+    mapbox_style (str, optional): Mapbox style to be used for the base map. Default is 'open-street-map'.
+
+    Returns:
+    go.Figure: The map, neither displayed nor saved.
+
+    Example:
+    >>> fig = build_figure(df_houses=df, df_county=df_zip, county=counties)
+    >>> update_map_layout(fig, lat=47.6, lon=-122.3, zoom=11)
+    >>> show_figure(fig, save_png='seattle.png', show=False)
+    """
+    # Collect all traces and layers first, so the figure validates them in one go
+    traces = []
+    mapbox_layers = []
+  
+    if df_county is not None and county is not None:
+        traces.append(choropleth_trace(df_county, county))
+    
+    if parks is not None:
+        traces.append(park_outlines_legend_trace())
+        mapbox_layers.append(park_outlines_layer(parks))
     
+    if df_schools is not None:
+        traces.append(schools_trace(df_schools))
+
+    if df_houses is not None:
+        traces.append(houses_trace(df_houses))
+
+    fig = go.Figure()
+    fig.add_traces(traces)
+    update_map_layout(fig, lat, lon, mapbox_style, mapbox_layers=mapbox_layers)
+
+    return fig
+
+#----------------------------------------------------------------------------------------------------------
+
+def show_figure(fig, save_png=None, show=True):
+    """
+    Displays a figure and/or saves it as a .png image.
+
+    Parameters:
+    fig (go.Figure): Plotly figure to display or save.
+    save_png (str, optional): File path to save the figure as a .png image.
+    show (bool, optional): Whether to display the figure. Set to False for export-only runs,
+        which skips serializing the figure to the browser. Default is True.
+
+    Returns:
+    None
+    """
+    if show:
+        fig.show()
+
+    if save_png is not None:
+        fig.write_image(save_png)
+
 #----------------------------------------------------------------------------------------------------------
 
 def vizualize_findings(
     df_houses=None, df_schools=None, df_county=None, parks=None, county=None, save_png=None,
-    lat=47.3464, lon=-121.9861, mapbox_style='open-street-map'    
+    lat=47.3464, lon=-121.9861, mapbox_style='open-street-map', show=True
 ):
     """
     Generates an interactive map with optional layers for houses, schools, county data, and park outlines.
@@ -248,31 +666,17 @@ def vizualize_findings(
     lat (float, optional): Latitude coordinate for centering the map. Default is 47.6003.
     lon (float, optional): Longitude coordinate for centering the map. Default is -122.1755.
     mapbox_style (str, optional): Mapbox style to be used for the base map. Default is 'open-street-map'.
+    show (bool, optional): Whether to display the map. Default is True.
 
     Returns:
     None
 
+    To reuse the map, e.g. for exports at other zoom levels, use `build_figure` and `show_figure`.
+
     This function generates an interactive map using Plotly and displays various spatial datasets
     such as houses, schools, parks, and county choropleth maps. The map is centered on the specified
     latitude and longitude coordinates. If `save_png` is provided, the map is saved as a .png file
     at the specified path.
     """
-    fig = go.Figure()
-  
-    if df_county is not None and county is not None:
-        add_choropleth_map(df_county, fig, county)
-    
-    if parks is not None:
-        add_park_outlines_layer(fig, parks)
-    
-    if df_schools is not None:
-        add_schools_layer(fig, df_schools)
-
-    if df_houses is not None:
-        plotting_houses(df_houses, fig)
-
-    update_map_layout(fig, lat, lon, mapbox_style)
-    fig.show()
-
-    if save_png is not None:
-        fig.write_image(save_png)
+    fig = build_figure(df_houses, df_schools, df_county, parks, county, lat, lon, mapbox_style)
+    show_figure(fig, save_png, show)